@@ -2,12 +2,12 @@ import time
 from modules.models import CSV_COLUMNS
 from modules.systems import fetch_candidates
 from modules.filters import Filter
-from modules.export import autosave_csv
+from modules.export import autosave
 from modules.input import user_input
 
 
 def main():
-  centre, radius_ly, min_planets, exclude_uncolonisable = user_input()
+  centre, radius_ly, min_planets, exclude_uncolonisable, export_format = user_input()
   cands = fetch_candidates(    
     centre=centre,
     radius_ly=radius_ly,
@@ -25,12 +25,14 @@ def main():
   ) 
   
 
-  autosave_csv(survivors, base_name="search_results", columns=CSV_COLUMNS, sort_key=lambda x: x.planet_count, reverse=True)
+  #csv is for reading by eye so it gets sorted, the other formats stream straight through
+  sort_key = (lambda x: x.planet_count) if export_format == "csv" else None
+  out_path = autosave(survivors, fmt=export_format, base_name="search_results", columns=CSV_COLUMNS, sort_key=sort_key, reverse=True)
 
   if len(cands) > 0:
     Filter().print_culled_report(culled)
     print(f"[EDASS] Fetched {len(cands)}  | Survivors: {len(survivors)} | Culled: {len(culled)}")
-    print("[EDASS] Exported filtered candidates to export/search_results.csv")
+    print(f"[EDASS] Exported filtered candidates to {out_path}")
     print("[EDASS] Done.")
   else: print("[EDASS] No candidates processed.")
 
@@ -1,10 +1,32 @@
 from __future__ import annotations
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
+from itertools import islice
 from pathlib import Path
+from abc import ABC, abstractmethod
 import csv
+import json
+import sqlite3
+import tempfile
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional, only needed for parquet export
+    pa = None
+    pq = None
 
 from .models import SystemCandidate, CSV_COLUMNS
 
+#parquet column types, anything not listed is stored as a string
+_ARROW_TYPES = {
+    "Distance (ly)": pa.float64(),
+    "Stars": pa.int64(),
+    "Planets": pa.int64(),
+    "Interesting Planets": pa.int64(),
+    "Landables": pa.int64(),
+    "Rings": pa.int64(),
+} if pa is not None else {}
+
 def ensure_export_dir() -> Path:
   export_dir = Path(__file__).parent.parent / "export"
   export_dir.mkdir(parents=True, exist_ok=True)
@@ -27,6 +49,191 @@ def _row_with_formatting(row: dict, columns: Sequence[str]) -> dict:
         out[k] = v
     return out
 
+def _batched(candidates: Iterable, size: int) -> Iterator[list]:
+    #pull bounded chunks off the iterator so nothing holds the whole survey in memory
+    it = iter(candidates)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+class Exporter(ABC):
+    #base for streaming writers: open() once, write_batch() per chunk, close() at the end.
+    #usable as a context manager, which does the open/close for you
+    extension = ""
+
+    def __init__(self, path: Path, *, columns: Sequence[str] = CSV_COLUMNS):
+        self.path = path
+        self.columns = list(columns)
+
+    def open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @abstractmethod
+    def write_batch(self, batch: list[SystemCandidate]) -> None:
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        ...
+
+    def __enter__(self) -> Exporter:
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _records(self, batch: list[SystemCandidate]) -> list[dict]:
+        out = []
+        for c in batch:
+            rec = c.to_record()
+            out.append({k: rec.get(k, "") for k in self.columns})
+        return out
+
+
+class CsvExporter(Exporter):
+    extension = "csv"
+
+    def open(self) -> None:
+        super().open()
+        self._f = self.path.open("w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._f, fieldnames=self.columns)
+        self._writer.writeheader()
+
+    def write_batch(self, batch: list[SystemCandidate]) -> None:
+        self._writer.writerows(_row_with_formatting(c.to_csv_row(), self.columns) for c in batch)
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class NdjsonExporter(Exporter):
+    extension = "ndjson"
+
+    def open(self) -> None:
+        super().open()
+        self._f = self.path.open("w", encoding="utf-8")
+
+    def write_batch(self, batch: list[SystemCandidate]) -> None:
+        self._f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in self._records(batch)))
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class SqliteExporter(Exporter):
+    #upserts by system name, so re-running a survey into the same db refreshes rows instead of duplicating them
+    extension = "sqlite"
+
+    def __init__(self, path: Path, *, columns: Sequence[str] = CSV_COLUMNS, table: str = "systems"):
+        if "System" not in columns:
+            raise ValueError("SQLite export needs the 'System' column as its key")
+        super().__init__(path, columns=columns)
+        self.table = table
+
+    def open(self) -> None:
+        super().open()
+        self._conn = sqlite3.connect(self.path)
+        cols = ", ".join(
+            f'"{k}" TEXT PRIMARY KEY' if k == "System" else f'"{k}"' for k in self.columns
+        )
+        quoted = ", ".join(f'"{k}"' for k in self.columns)
+        updates = ", ".join(f'"{k}" = excluded."{k}"' for k in self.columns if k != "System")
+        self._sql = (
+            f'INSERT INTO "{self.table}" ({quoted}) VALUES ({", ".join("?" for _ in self.columns)}) '
+            f'ON CONFLICT("System") DO ' + (f"UPDATE SET {updates}" if updates else "NOTHING")
+        )
+        try:
+            with self._conn:
+                self._conn.execute(f'CREATE TABLE IF NOT EXISTS "{self.table}" ({cols})')
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def write_batch(self, batch: list[SystemCandidate]) -> None:
+        rows = [tuple(r[k] for k in self.columns) for r in self._records(batch)]
+        with self._conn:  # one transaction per batch
+            self._conn.executemany(self._sql, rows)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class ColumnarJsonExporter(Exporter):
+    #column-major output without extra dependencies: one JSON object of column arrays per batch, one per line
+    extension = "columns.jsonl"
+
+    def open(self) -> None:
+        super().open()
+        self._f = self.path.open("w", encoding="utf-8")
+
+    def write_batch(self, batch: list[SystemCandidate]) -> None:
+        records = self._records(batch)
+        self._f.write(json.dumps({k: [r[k] for r in records] for k in self.columns}, ensure_ascii=False) + "\n")
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class ParquetExporter(Exporter):
+    #one parquet row group per batch, needs pyarrow
+    extension = "parquet"
+
+    def __init__(self, path: Path, *, columns: Sequence[str] = CSV_COLUMNS):
+        if pa is None:
+            raise ImportError("Parquet export needs pyarrow (pip install pyarrow), or use the 'columnar-json' format")
+        super().__init__(path, columns=columns)
+        self.schema = pa.schema([(k, _ARROW_TYPES.get(k, pa.string())) for k in self.columns])
+
+    def open(self) -> None:
+        super().open()
+        #created up front so an empty survey still replaces the previous file
+        self._writer = pq.ParquetWriter(str(self.path), self.schema)
+
+    def write_batch(self, batch: list[SystemCandidate]) -> None:
+        records = self._records(batch)
+        self._writer.write_table(pa.Table.from_pylist(records, schema=self.schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+EXPORTERS: dict[str, type[Exporter]] = {
+    "csv": CsvExporter,
+    "ndjson": NdjsonExporter,
+    "sqlite": SqliteExporter,
+    "columnar": ParquetExporter,
+    "columnar-json": ColumnarJsonExporter,
+}
+
+def available_formats() -> list[str]:
+    #formats usable in this environment, parquet drops out without pyarrow
+    return [k for k in EXPORTERS if k != "columnar" or pa is not None]
+
+def export(
+    candidates: Iterable,
+    exporter: Exporter, *,
+    batch_size: int = 500,
+    sort_key = None,
+    reverse: bool = False,
+) -> Path:
+
+    #checked before open() so a bad call doesn't truncate the previous export
+    if batch_size <= 0:
+        raise ValueError("batch_size must be > 0")
+
+    #sorting needs the whole set, so only materialise when asked to
+    if sort_key is not None:
+        candidates = sorted(candidates, key=sort_key, reverse=reverse)
+
+    with exporter:
+        for batch in _batched(candidates, batch_size):
+            exporter.write_batch(batch)
+    return exporter.path
+
 def write_csv(
     candidates: Iterable, path: Path, *,
     columns: Sequence[str] = CSV_COLUMNS,
@@ -34,17 +241,27 @@ def write_csv(
     reverse: bool = False,
 ) -> Path:
 
-    items = list(candidates)
-    if sort_key is not None:
-        items.sort(key=sort_key, reverse=reverse)
+    return export(candidates, CsvExporter(path, columns=columns), sort_key=sort_key, reverse=reverse)
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=list(columns))
-        writer.writeheader()
-        for c in items:
-            writer.writerow(_row_with_formatting(c.to_csv_row(), columns))
-    return path
+def autosave(
+    candidates: Iterable,
+    *,
+    fmt: str = "csv",
+    base_name: str = "system_candidates",
+    columns: Sequence[str] = CSV_COLUMNS,
+    batch_size: int = 500,
+    sort_key = None,
+    reverse: bool = False,
+) -> Path:
+
+    #save to export/<base_name>.<ext> (overwrites each run, sqlite upserts into the existing db).
+
+    try:
+        cls = EXPORTERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unknown export format {fmt!r}, expected one of {', '.join(EXPORTERS)}") from None
+    out_path = ensure_export_dir() / f"{base_name}.{cls.extension}"
+    return export(candidates, cls(out_path, columns=columns), batch_size=batch_size, sort_key=sort_key, reverse=reverse)
 
 def autosave_csv(
     candidates: Iterable,
@@ -57,9 +274,7 @@ def autosave_csv(
     
     #save to export/<base_name>.csv (overwrites each run for reproducibility).
     
-    export_dir = ensure_export_dir()
-    out_path = export_dir / f"{base_name}.csv"
-    return write_csv(candidates, out_path, columns=columns, sort_key=sort_key, reverse=reverse)
+    return autosave(candidates, fmt="csv", base_name=base_name, columns=columns, sort_key=sort_key, reverse=reverse)
 
 
 def test() -> None:
@@ -91,6 +306,72 @@ def test() -> None:
   )
   print(f"Wrote {len(candidates)} candidates to {out_path}")
 
+  #streaming backends, written to a scratch dir so export/ only holds the demo csv
+  with tempfile.TemporaryDirectory() as tmp:
+    tmp = Path(tmp)
+
+    #csv output must stay byte-identical to the pre-exporter version
+    assert out_path.read_bytes() == (
+      b"System,Distance (ly),Primary star,Stars,Planets,Interesting Planets,Landables,Rings,Notes\r\n"
+      b"Alpha Centauri,4.37,Unknown,0,3,0,0,0,demo entry\r\n"
+      b"Barnard's Star,5.97,Unknown,0,1,0,0,0,another demo\r\n"
+      b"Wolf 1061,13.80,Unknown,0,3,0,0,0,third demo\r\n"
+    ), "csv output changed"
+
+    nd = export(iter(candidates), NdjsonExporter(tmp / "t.ndjson"), batch_size=2)
+    rows = [json.loads(line) for line in nd.read_text(encoding="utf-8").splitlines()]
+    assert [r["System"] for r in rows] == [x.name for x in candidates]
+    assert rows[1]["Distance (ly)"] == 5.97 and rows[1]["Planets"] == 1
+
+    #upsert twice, second run changes a value but must not duplicate rows
+    db = tmp / "t.sqlite"
+    export(iter(candidates), SqliteExporter(db), batch_size=2)
+    a.planet_count = 5
+    export(iter(candidates), SqliteExporter(db), batch_size=2)
+    a.planet_count = 3
+    conn = sqlite3.connect(db)
+    try:
+      assert conn.execute('SELECT COUNT(*) FROM systems').fetchone()[0] == len(candidates)
+      planets, dist = conn.execute(
+        'SELECT "Planets", "Distance (ly)" FROM systems WHERE "System" = ?', (a.name,)
+      ).fetchone()
+      assert planets == 5 and isinstance(planets, int) and dist == 4.37
+    finally:
+      conn.close()
+
+    cj = export(iter(candidates), ColumnarJsonExporter(tmp / "t.columns.jsonl"), batch_size=2)
+    groups = [json.loads(line) for line in cj.read_text(encoding="utf-8").splitlines()]
+    assert [len(g["System"]) for g in groups] == [2, 1]
+
+    #empty survey still replaces the previous file
+    for cls in (CsvExporter, NdjsonExporter, ColumnarJsonExporter) + ((ParquetExporter,) if pa else ()):
+      p = tmp / f"t.{cls.extension}"
+      export(iter(candidates), cls(p))
+      export(iter(()), cls(p))
+      if cls is ParquetExporter:
+        assert pq.read_table(p).num_rows == 0
+      elif cls is CsvExporter:
+        assert p.read_text(encoding="utf-8").splitlines() == [",".join(CSV_COLUMNS)]
+      else:
+        assert p.read_text(encoding="utf-8") == ""
+
+    if pa:
+      p = export(iter(candidates), ParquetExporter(tmp / "t.parquet"), batch_size=2)
+      table = pq.read_table(p)
+      assert table.num_rows == len(candidates) and table.schema.field("Planets").type == pa.int64()
+
+    #bad batch_size is rejected before the old export is touched
+    before = out_path.read_bytes()
+    try:
+      export(iter(candidates), CsvExporter(out_path), batch_size=0)
+    except ValueError:
+      pass
+    else:
+      raise AssertionError("batch_size=0 accepted")
+    assert out_path.read_bytes() == before
+
+  print("Exporter checks passed")
+
   
 
 if __name__ == "__main__":
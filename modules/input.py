@@ -1,6 +1,8 @@
 
 
 
+from .export import available_formats
+
 def user_input():
     print("Welcome to EDASS (Elite Dangerous Automatic System Survey) v0.3!")
     print("This tool helps you find uncolonised systems in Elite Dangerous.")
@@ -45,5 +47,10 @@ def user_input():
         exclude_uncolonisable = True
         print("Input invalid, defaulting to true.")
 
+    formats = available_formats()
+    export_format = input(f"Export format ({', '.join(formats)}, default csv): ").strip().lower() or "csv"
+    while export_format not in formats:
+        print("Unknown or unavailable format. Please try again.")
+        export_format = input(f"Export format ({', '.join(formats)}, default csv): ").strip().lower() or "csv"
     
-    return centre, radius, min_planets, exclude_uncolonisable
\ No newline at end of file
+    return centre, radius, min_planets, exclude_uncolonisable, export_format
\ No newline at end of file
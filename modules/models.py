@@ -48,6 +48,12 @@ class SystemCandidate:
         "Notes": self.note_str
     }
     return row
+
+  def to_record(self) -> dict:
+    #same columns as to_csv_row, but typed values for non-CSV exporters
+    row = self.to_csv_row()
+    row["Distance (ly)"] = round(self.distance_ly, 2)
+    return row
   
 
 